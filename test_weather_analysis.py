@@ -0,0 +1,175 @@
+import json
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from weather_analysis import (ObservationBlock, calculate_gdd, process_daily_data,
+                              process_weather_data)
+
+
+# Implémentations d'origine (liste de dicts), servent de référence
+def reference_daily_data(data):
+    records = []
+    for record in data:
+        date_time = record.get("date", "")
+        if not date_time:
+            continue
+
+        records.append({
+            "Date": date_time.split("T")[0],
+            "Heure": date_time.split("T")[1][:5],
+            "Température (°C)": round(record.get("tc"), 1) if record.get("tc") is not None else None,
+            "Humidité (%)": record.get("u"),
+            "Précipitations (mm)": record.get("rr1")
+        })
+
+    df = pd.DataFrame(records)
+
+    if df.empty:
+        return df
+
+    df["Heure"] = pd.to_datetime(df["Heure"], format="%H:%M", errors="coerce").dt.strftime("%H:%M")
+    df.sort_values(by=["Date", "Heure"], inplace=True)
+
+    df["Température (°C)"] = df["Température (°C)"].interpolate(method="linear")
+    df["Humidité (%)"] = df["Humidité (%)"].interpolate(method="linear")
+    df.dropna(subset=["Température (°C)", "Humidité (%)"], inplace=True)
+
+    return df
+
+
+def reference_weather_data(data):
+    records = []
+    for record in data:
+        date_time = record.get("date", "")
+        if not date_time:
+            continue
+
+        records.append({
+            "Date": date_time.split("T")[0],
+            "Température min (°C)": record.get("tn12c"),
+            "Température max (°C)": record.get("tx12c"),
+            "Humidité (%)": record.get("u")
+        })
+
+    df = pd.DataFrame(records)
+    if df.empty:
+        return df
+
+    df = df.groupby("Date").agg({
+        "Température min (°C)": "min",
+        "Température max (°C)": "max",
+        "Humidité (%)": "mean"
+    }).reset_index()
+
+    return df
+
+
+def make_block(data, station=None, capacity=1024):
+    block = ObservationBlock(capacity)
+    block.extend(data, station)
+    return block
+
+
+def assert_same_frame(new, old):
+    labels = {column: object for column in ("Date", "Heure") if column in new}
+    pd.testing.assert_frame_equal(new.astype(labels).reset_index(drop=True),
+                                  old.astype(labels).reset_index(drop=True))
+
+
+@pytest.fixture
+def orly():
+    with open("data/weather_ORLY_2025-01-01.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def half_steps():
+    # 400 relevés horaires en Kelvin par pas de 0,05 K, dont beaucoup tombent en .x5 °C
+    rng = random.Random(0)
+    start = datetime(2025, 3, 1)
+    data = []
+    for i in range(400):
+        kelvin = [rng.randrange(25000, 30000, 5) / 100 for _ in range(3)]
+        tc, tn, tx = (k - 273.15 for k in kelvin)
+        data.append({
+            "date": (start + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+            "nom": "ORLY",
+            "tc": None if i % 37 == 5 else tc,
+            "u": None if i % 53 == 7 else rng.randrange(30, 101),
+            "rr1": rng.randrange(0, 50) / 10,
+            "tn12c": tn if i % 12 == 6 else None,
+            "tx12c": tx if i % 12 == 6 else None,
+        })
+    rng.shuffle(data)
+    return data
+
+
+def test_daily_matches_reference_on_sample(orly):
+    df = process_daily_data(make_block(orly, "ORLY"))
+    assert_same_frame(df, reference_daily_data(orly))
+    assert df.to_dict(orient="records") == reference_daily_data(orly).to_dict(orient="records")
+    assert df["Humidité (%)"].dtype == np.int64
+
+
+def test_monthly_matches_reference_on_sample(orly):
+    df = calculate_gdd(process_weather_data(make_block(orly)))
+    assert_same_frame(df, calculate_gdd(reference_weather_data(orly)))
+
+
+def test_daily_matches_reference_on_half_steps(half_steps):
+    df = process_daily_data(make_block(half_steps, "ORLY"))
+    assert_same_frame(df, reference_daily_data(half_steps))
+
+
+def test_monthly_matches_reference_on_half_steps(half_steps):
+    df = calculate_gdd(process_weather_data(make_block(half_steps)))
+    assert_same_frame(df, calculate_gdd(reference_weather_data(half_steps)))
+
+
+def test_extend_grows_capacity(orly):
+    block = make_block(orly * 5, capacity=2)
+    assert len(block) == 40
+    assert len(block.time) == 64
+    assert block.times()[0] == np.datetime64("2025-01-01T00:00")
+    np.testing.assert_array_equal(block.column("u"), [r["u"] for r in orly] * 5)
+
+
+def test_extend_stores_none_as_nan(orly):
+    block = make_block(orly)
+    assert np.isnan(block.column("tn12c")).sum() == sum(r["tn12c"] is None for r in orly)
+
+
+def test_extend_filters_and_interns_stations():
+    data = [
+        {"date": "2025-01-01T00:00:00+00:00", "nom": "ORLY", "u": 80},
+        {"date": "2025-01-01T03:00:00+00:00", "nom": "PARIS-ORLY", "u": 81},
+        {"date": "2025-01-01T06:00:00+00:00", "nom": "ROUEN-BOOS", "u": 82},
+        {"date": "2025-01-01T09:00:00+00:00", "nom": "orly", "u": 83},
+    ]
+    block = make_block(data, "orly")
+    assert len(block) == 3
+    assert block.stations == ["ORLY", "PARIS-ORLY", "orly"]
+    np.testing.assert_array_equal(block.station[:len(block)], [0, 1, 2])
+
+    assert len(make_block(data)) == 4
+
+
+def test_extend_skips_missing_or_malformed_dates():
+    data = [
+        {"date": "", "tc": 1.0},
+        {"tc": 2.0},
+        {"date": "pas une date", "tc": 3.0},
+        {"date": "2025-01-01T00:00:00+00:00", "tc": 4.0},
+    ]
+    block = make_block(data)
+    assert len(block) == 1
+    np.testing.assert_array_equal(block.column("tc"), [4.0])
+
+
+def test_empty_block_gives_empty_frames():
+    assert process_daily_data(ObservationBlock()).empty
+    assert process_weather_data(ObservationBlock()).empty
@@ -1,6 +1,7 @@
 import requests
 import json
 import calendar
+import numpy as np
 import pandas as pd
 import matplotlib
 matplotlib.use('Agg')  # Utilise le backend non-GUI adapté aux serveurs au cas où toi qui lis t'es sur Mac
@@ -31,9 +32,102 @@ def create_data_directory():
     data_dir.mkdir(exist_ok=True)
     return data_dir
 
+
+KELVIN = 273.15
+
+
+# Bloc d'observations stocké en colonnes (struct-of-arrays) plutôt qu'en liste de dicts :
+# horodatage datetime64[m], mesures float32 et identifiant de station interné (uint16).
+# Soit 30 octets par observation (8 + 5 x 4 + 2), ~60 octets au pire juste après un doublement
+# de capacité. Pics mesurés de chaque étape du pipeline : voir README.
+#
+# Les valeurs sources sont au centième (températures en Kelvin par pas de 0,05 K, humidité
+# entière, précipitations au dixième de mm). On stocke donc les températures en Kelvin
+# arrondies au centième : la précision de float32 suffit à retrouver ce centième, et `decode`
+# redonne au bit près les °C de l'API (K - 273.15), y compris les valeurs en .x5.
+class ObservationBlock:
+    FIELDS = ("tc", "u", "rr1", "tn12c", "tx12c")
+    OFFSETS = {"tc": KELVIN, "tn12c": KELVIN, "tx12c": KELVIN}
+
+    def __init__(self, capacity=1024):
+        self.size = 0
+        self.stations = []
+        self._station_ids = {}
+        self.time = np.empty(capacity, dtype="datetime64[m]")
+        self.station = np.empty(capacity, dtype=np.uint16)
+        self.values = {field: np.empty(capacity, dtype=np.float32) for field in self.FIELDS}
+
+    def __len__(self):
+        return self.size
+
+    def _grow(self):
+        capacity = 2 * len(self.time)
+        self.time = _resized(self.time, capacity)
+        self.station = _resized(self.station, capacity)
+        for field in self.FIELDS:
+            self.values[field] = _resized(self.values[field], capacity)
+
+    def _intern(self, name):
+        station_id = self._station_ids.get(name)
+        if station_id is None:
+            station_id = self._station_ids[name] = len(self.stations)
+            self.stations.append(name)
+        return station_id
+
+    def extend(self, results, station=None):
+        for entry in results:
+            name = entry.get("nom", "")
+            if station and station.upper() not in name.upper():
+                continue
+            date_time = entry.get("date", "")
+            if not date_time:
+                continue
+            try:
+                timestamp = np.datetime64(date_time[:16])  # "YYYY-MM-DDTHH:MM"
+            except ValueError:
+                continue
+
+            if self.size == len(self.time):
+                self._grow()
+            i = self.size
+            self.time[i] = timestamp
+            self.station[i] = self._intern(name)
+            for field in self.FIELDS:
+                value = entry.get(field)
+                if value is None:
+                    self.values[field][i] = np.nan
+                else:
+                    self.values[field][i] = round(value + self.OFFSETS.get(field, 0), 2)
+            self.size += 1
+
+    def times(self):
+        return self.time[:self.size]
+
+    def raw(self, field):
+        return self.values[field][:self.size]
+
+    def decode(self, field, values):
+        values = values.astype(np.float64)
+        np.round(values, 2, out=values)
+        values -= self.OFFSETS.get(field, 0)
+        return values
+
+    def column(self, field):
+        return self.decode(field, self.raw(field))
+
+
+def _resized(array, capacity):
+    new_array = np.empty(capacity, dtype=array.dtype)
+    new_array[:len(array)] = array
+    return new_array
+
+
+OBSERVATION_SELECT = ",".join(("date", "nom") + ObservationBlock.FIELDS)
+
+
 def get_weather_data(station, date):
     base_url = "https://data.opendatasoft.com/api/explore/v2.1/catalog/datasets/donnees-synop-essentielles-omm@public/records"
-    all_data = []
+    block = ObservationBlock()
     offset = 0
     limit = 100
 
@@ -42,6 +136,7 @@ def get_weather_data(station, date):
             "limit": limit,
             "offset": offset,
             "where": f"date >= '{date}T00:00:00Z' AND date <= '{date}T23:59:59Z' AND nom = '{station}'",
+            "select": OBSERVATION_SELECT,
             "sort": "date"
         }
 
@@ -52,7 +147,7 @@ def get_weather_data(station, date):
             results = data.get("results", [])
             if not results:
                 break
-            all_data.extend(results)
+            block.extend(results, station)
             offset += limit
         except requests.Timeout:
             print("Temps d'attente dépassé !")
@@ -61,31 +156,36 @@ def get_weather_data(station, date):
             print(f"Erreur API : {e}")
             break
 
-    return [entry for entry in all_data if station.upper() in entry.get("nom", "").upper()]
+    return block
 
 
-def process_daily_data(data):
-    records = []
-    for record in data:
-        date_time = record.get("date", "")
-        if not date_time:
-            continue
+def process_daily_data(block):
+    if not len(block):
+        return pd.DataFrame()
 
-        records.append({
-            "Date": date_time.split("T")[0],
-            "Heure": date_time.split("T")[1][:5],
-            "Température (°C)": round(record.get("tc"), 1) if record.get("tc") is not None else None,
-            "Humidité (%)": record.get("u"),
-            "Précipitations (mm)": record.get("rr1")
-        })
+    order = np.argsort(block.times(), kind="stable")
+    times = block.times()[order]
+    days = times.astype("datetime64[D]")
+    minutes = (times - days).astype(np.int64)
 
-    df = pd.DataFrame(records)
+    # Date et Heure en catégories : une chaîne par jour / par heure distincte, pas par ligne
+    day_values, day_codes = np.unique(days, return_inverse=True)
+    minute_values, minute_codes = np.unique(minutes, return_inverse=True)
+    del times, days, minutes
 
-    if df.empty:
-        return df
+    # round() de Python comme avant, np.round ne tranche pas les .x5 de la même façon
+    tc = block.decode("tc", block.raw("tc")[order])
+    humidity = block.column("u")[order]
+    if not np.isnan(humidity).any():
+        humidity = humidity.astype(np.int64)
 
-    df["Heure"] = pd.to_datetime(df["Heure"], format="%H:%M", errors="coerce").dt.strftime("%H:%M")
-    df.sort_values(by=["Date", "Heure"], inplace=True)
+    df = pd.DataFrame({
+        "Date": pd.Categorical.from_codes(day_codes, np.datetime_as_string(day_values)),
+        "Heure": pd.Categorical.from_codes(minute_codes, [f"{m // 60:02d}:{m % 60:02d}" for m in minute_values]),
+        "Température (°C)": np.fromiter((round(float(t), 1) for t in tc), dtype=np.float64, count=len(tc)),
+        "Humidité (%)": humidity,
+        "Précipitations (mm)": block.column("rr1")[order]
+    })
 
     df["Température (°C)"] = df["Température (°C)"].interpolate(method="linear")
     df["Humidité (%)"] = df["Humidité (%)"].interpolate(method="linear")
@@ -102,40 +202,35 @@ def get_monthly_weather_data(station, year, month):
     params = {
         "refine.nom": station,
         "where": f"date >= '{date_prefix}-01T00:00:00Z' AND date <= '{date_prefix}-{last_day}T23:59:59Z'",
+        "select": OBSERVATION_SELECT,
         "timezone": "UTC"
     }
 
+    block = ObservationBlock()
     try:
         response = requests.get(base_url, params=params, timeout=30)
         response.raise_for_status()
-        data = response.json()
-        if not data:
+        block.extend(response.json())
+        if not block:
             print(f" Aucune donnée trouvée pour {station} en {date_prefix}.")
-            return []
-        return data
+        return block
 
     except requests.RequestException as e:
         print(f" Erreur API : {e}")
-        return []
-
+        return block
 
-def process_weather_data(data):
-    records = []
-    for record in data:
-        date_time = record.get("date", "")
-        if not date_time:
-            continue
 
-        records.append({
-            "Date": date_time.split("T")[0],
-            "Température min (°C)": record.get("tn12c"),
-            "Température max (°C)": record.get("tx12c"),
-            "Humidité (%)": record.get("u")
-        })
+def process_weather_data(block):
+    if not len(block):
+        return pd.DataFrame()
 
-    df = pd.DataFrame(records)
-    if df.empty:
-        return df
+    # min/max directement sur les Kelvin float32, conversion en °C sur une ligne par jour
+    df = pd.DataFrame({
+        "Date": block.times().astype("datetime64[D]"),
+        "Température min (°C)": block.raw("tn12c"),
+        "Température max (°C)": block.raw("tx12c"),
+        "Humidité (%)": block.column("u")
+    })
 
     df = df.groupby("Date").agg({
         "Température min (°C)": "min",
@@ -143,6 +238,10 @@ def process_weather_data(data):
         "Humidité (%)": "mean"
     }).reset_index()
 
+    df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
+    df["Température min (°C)"] = block.decode("tn12c", df["Température min (°C)"].to_numpy())
+    df["Température max (°C)"] = block.decode("tx12c", df["Température max (°C)"].to_numpy())
+
     return df
 
 